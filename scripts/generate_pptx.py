@@ -15,60 +15,155 @@ Requires:
 """
 
 import argparse
+import functools
+import io
+import os
+import re
+import zipfile
+from dataclasses import dataclass
 from pathlib import Path
-from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
-from pptx.enum.shapes import MSO_SHAPE
-from pptx.dml.color import RGBColor
+from types import MappingProxyType
+
+# python-pptx (and lxml beneath it) is imported on first use by
+# _import_pptx(), so `--help` and argument errors return immediately
+Presentation = Inches = Pt = PP_ALIGN = MSO_ANCHOR = MSO_SHAPE = RGBColor = None
+
+
+def _import_pptx():
+    """Bind the python-pptx names used throughout this module"""
+    global Presentation, Inches, Pt, PP_ALIGN, MSO_ANCHOR, MSO_SHAPE, RGBColor
+    if Presentation is not None:
+        return
+    from pptx import Presentation
+    from pptx.util import Inches, Pt
+    from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
+    from pptx.enum.shapes import MSO_SHAPE
+    from pptx.dml.color import RGBColor
+
+
+_Image = None
+
+
+def _get_pil():
+    """Return PIL.Image, imported on the first screenshot rather than at load"""
+    global _Image
+    if _Image is None:
+        from PIL import Image as _Image
+    return _Image
 
 
 # ============ COLOR PALETTES ============
-# Multiple themes for different storytelling contexts
-
-PALETTES = {
-    'default': {
-        'primary': RGBColor(0x00, 0x66, 0xCC),
-        'primary_dark': RGBColor(0x00, 0x52, 0xA3),
-        'secondary': RGBColor(0x1E, 0x29, 0x3B),
-        'accent': RGBColor(0x10, 0xB9, 0x81),
-        'warning': RGBColor(0xD9, 0x77, 0x06),
-        'danger': RGBColor(0xDC, 0x26, 0x26),
-        'success': RGBColor(0x16, 0xA3, 0x4A),
-        'purple': RGBColor(0x8B, 0x5C, 0xF6),
-        'white': RGBColor(0xFF, 0xFF, 0xFF),
-        'light_gray': RGBColor(0xF8, 0xFA, 0xFC),
-        'muted': RGBColor(0x64, 0x74, 0x8B),
-        'border': RGBColor(0xE2, 0xE8, 0xF0),
-    },
+# Multiple themes for different storytelling contexts.
+# Colors are stored as 'RRGGBB' hex strings; resolve_palette(name) turns an
+# entry into a Palette of RGBColors for the builders. The tables are read-only
+# because resolve_palette() caches what it builds from them.
+
+PALETTES = MappingProxyType({
+    'default': MappingProxyType({
+        'primary': '0066CC',
+        'primary_dark': '0052A3',
+        'secondary': '1E293B',
+        'accent': '10B981',
+        'warning': 'D97706',
+        'danger': 'DC2626',
+        'success': '16A34A',
+        'purple': '8B5CF6',
+        'white': 'FFFFFF',
+        'light_gray': 'F8FAFC',
+        'muted': '64748B',
+        'border': 'E2E8F0',
+    }),
     # Iceberg extends default with storytelling colors for problem slides
-    'iceberg': {
+    'iceberg': MappingProxyType({
         # Base colors (same as default)
-        'primary': RGBColor(0x00, 0x66, 0xCC),
-        'primary_dark': RGBColor(0x00, 0x52, 0xA3),
-        'secondary': RGBColor(0x1E, 0x29, 0x3B),
-        'accent': RGBColor(0x10, 0xB9, 0x81),
-        'warning': RGBColor(0xD9, 0x77, 0x06),
-        'danger': RGBColor(0xDC, 0x26, 0x26),
-        'success': RGBColor(0x16, 0xA3, 0x4A),
-        'purple': RGBColor(0x8B, 0x5C, 0xF6),
-        'white': RGBColor(0xFF, 0xFF, 0xFF),
-        'light_gray': RGBColor(0xF8, 0xFA, 0xFC),
-        'muted': RGBColor(0x64, 0x74, 0x8B),
-        'border': RGBColor(0xE2, 0xE8, 0xF0),
+        'primary': '0066CC',
+        'primary_dark': '0052A3',
+        'secondary': '1E293B',
+        'accent': '10B981',
+        'warning': 'D97706',
+        'danger': 'DC2626',
+        'success': '16A34A',
+        'purple': '8B5CF6',
+        'white': 'FFFFFF',
+        'light_gray': 'F8FAFC',
+        'muted': '64748B',
+        'border': 'E2E8F0',
         # Iceberg-specific storytelling colors
-        'sky': RGBColor(0xE0, 0xF2, 0xFE),
-        'sky_mid': RGBColor(0xBA, 0xE6, 0xFD),
-        'ocean': RGBColor(0x02, 0x84, 0xC7),
-        'ocean_deep': RGBColor(0x0C, 0x4A, 0x6E),
-        'text_light': RGBColor(0xFF, 0xFF, 0xFF),
-        'text_sky': RGBColor(0x03, 0x69, 0xA1),
-    },
-}
-
-COLORS = PALETTES['default']
-
-# Screenshot configuration - map slide numbers to expected file patterns
+        'sky': 'E0F2FE',
+        'sky_mid': 'BAE6FD',
+        'ocean': '0284C7',
+        'ocean_deep': '0C4A6E',
+        'text_light': 'FFFFFF',
+        'text_sky': '0369A1',
+    }),
+})
+
+# Fixed accents that stay the same under every palette
+SUBTITLE_BLUE = 'A0C4E8'   # secondary text on primary-filled shapes
+ALERT_ORANGE = 'EA580C'    # the iceberg's above-water figure
+CALLOUT_FILL = 'FFFBEB'
+CALLOUT_BORDER = 'FCD34D'
+CALLOUT_TEXT = '92400E'
+
+
+@functools.lru_cache(maxsize=None)
+def _rgb(hex6):
+    """RGBColor for an 'RRGGBB' hex string, built once per distinct color"""
+    return RGBColor.from_string(hex6)
+
+
+@dataclass(frozen=True)
+class Palette:
+    """A PALETTES entry resolved to RGBColors, read as attributes (colors.primary)"""
+    primary: 'RGBColor'
+    primary_dark: 'RGBColor'
+    secondary: 'RGBColor'
+    accent: 'RGBColor'
+    warning: 'RGBColor'
+    danger: 'RGBColor'
+    success: 'RGBColor'
+    purple: 'RGBColor'
+    white: 'RGBColor'
+    light_gray: 'RGBColor'
+    muted: 'RGBColor'
+    border: 'RGBColor'
+    # Storytelling colors, only defined by the iceberg palette
+    sky: 'RGBColor' = None
+    sky_mid: 'RGBColor' = None
+    ocean: 'RGBColor' = None
+    ocean_deep: 'RGBColor' = None
+    text_light: 'RGBColor' = None
+    text_sky: 'RGBColor' = None
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_palette(name):
+    """Palette for a PALETTES name, built once; unknown names use 'default'"""
+    entries = PALETTES.get(name, PALETTES['default'])
+    return Palette(**{key: _rgb(value) for key, value in entries.items()})
+
+
+def as_rgb(color, colors):
+    """Pass an RGBColor through, or resolve a palette entry name against colors"""
+    return getattr(colors, color) if isinstance(color, str) else color
+
+
+# Unit conversions for the layout: each distinct inch/point value is converted
+# to an EMU Length once and then reused. The caches hold layout-derived values
+# (grid literals and offsets such as a card's x + 0.2); sizes that depend on
+# the content (list heights, fitted screenshots) call Inches() directly.
+@functools.lru_cache(maxsize=None)
+def _in(inches):
+    return Inches(inches)
+
+
+@functools.lru_cache(maxsize=None)
+def _pt(points):
+    return Pt(points)
+
+
+# Slides that show a screenshot, with a suggested file name for each. Any image
+# whose name contains the slide number as a standalone number (04 or 4) matches.
 SCREENSHOT_SLIDES = {
     4: 'slide_04_architecture',
     5: 'slide_05_demo',
@@ -77,100 +172,141 @@ SCREENSHOT_SLIDES = {
     8: 'slide_08_audit',
 }
 
+# Fixed prefixes for card titles and list items, concatenated rather than
+# f-string formatted inside the per-item loops
+CHECK_PREFIX = "✓ "
+TITLE_INDENT = "  "
+DESC_INDENT = "     "
+NUM_GAP = "   "
+
+# Left edges of the two side-by-side panels (slides 9 and 10); text sits
+# PANEL_INSET inside each panel
+PANEL_X = (0.75, 6.4)
+PANEL_INSET = 0.25
+
+# Speaker notes per slide number - timing, talking points, transitions
+SPEAKER_NOTES = {
+    1: """TIMING: 30 seconds
+SAY: Lead with your value prop
+TRANSITION: Click next to show the problem""",
+    2: """TIMING: 45 seconds
+SAY: The visible cost is just the tip of the iceberg.
+TRANSITION: "Here's the scale we're dealing with..." """,
+    3: """TIMING: 30 seconds
+SAY: Emphasize the magnitude
+TRANSITION: "Here's the architecture..." """,
+    4: """TIMING: 45 seconds
+SAY: Walk through the architecture
+SHOW: Point to each stage""",
+    5: """TIMING: 60 seconds
+SAY: "Watch what happens when..."
+SHOW: Run the demo""",
+    6: """TIMING: 60 seconds
+SAY: "This is the key differentiator"
+SHOW: Edge case handling""",
+    7: """TIMING: 30 seconds
+SAY: Back up your claims with numbers""",
+    8: """TIMING: 30 seconds
+SAY: Complete traceability""",
+    9: """TIMING: 30 seconds
+SAY: Be honest about gaps
+SHOW: Point to roadmap""",
+    10: """TIMING: 30 seconds
+SAY: Be specific about what you need
+ASK: Open it up for questions""",
+}
+
 
 # ============ SCREENSHOT HELPERS ============
 
-def find_screenshot(screenshots_dir, slide_name, slide_num=None):
-    """Find screenshot file for a slide (flexible naming, supports .png, .jpg, .jpeg)"""
-    if not screenshots_dir:
-        return None
-
-    screenshots_path = Path(screenshots_dir)
-    if not screenshots_path.exists():
-        return None
-
-    if slide_num:
-        patterns = [
-            f"*{slide_num:02d}*",
-            f"*{slide_num}*",
-        ]
-
-        for pattern in patterns:
-            for ext in ['.png', '.jpg', '.jpeg']:
-                matches = list(screenshots_path.glob(f"{pattern}{ext}")) + \
-                          list(screenshots_path.glob(f"{pattern}{ext.upper()}"))
-                if matches:
-                    return str(sorted(matches)[0])
-
-    possible_names = [slide_name]
-    if slide_num:
-        possible_names.extend([
-            f"slide_{slide_num:02d}",
-            f"Slide_{slide_num:02d}",
-            f"{slide_num:02d}",
-            f"{slide_num}",
-        ])
-
-    for name in possible_names:
-        for ext in ['.png', '.jpg', '.jpeg', '.PNG', '.JPG', '.JPEG']:
-            screenshot_file = screenshots_path / f"{name}{ext}"
-            if screenshot_file.exists():
-                return str(screenshot_file)
-
-    return None
+# Standalone one- or two-digit numbers in a file name: "app1_05" -> 1 and 5
+_SLIDE_NUM = re.compile(r'(?<!\d)\d{1,2}(?!\d)')
+# Image extension; matching types in order of preference when a slide has several
+_IMAGE_EXT = re.compile(r'\.(png|jpe?g)$', re.IGNORECASE)
+_IMAGE_EXTS = ('png', 'jpg', 'jpeg')
 
 
-def add_screenshot(slide, screenshot_path, x=0.75, y=2.3, max_width=11.5, max_height=4.2):
-    """Add screenshot image to slide, preserving aspect ratio"""
-    if screenshot_path and Path(screenshot_path).exists():
-        from PIL import Image
+def index_screenshots(screenshots_dir):
+    """Map slide number -> screenshot path in one directory scan (.png, .jpg, .jpeg)
 
-        # Get original image dimensions
-        with Image.open(screenshot_path) as img:
-            img_width, img_height = img.size
+    A file is a candidate for every standalone number in its name. Per slide,
+    a zero-padded match ("05") beats a bare one ("5"), then .png beats .jpg
+    beats .jpeg, then the alphabetically first name wins. Digits inside a
+    longer number don't count, so slide_14.png is not a screenshot for slide 4.
+    """
+    if not screenshots_dir or not os.path.isdir(screenshots_dir):
+        return {}
 
-        # Calculate aspect ratio
-        aspect_ratio = img_width / img_height
+    best = {}
+    with os.scandir(screenshots_dir) as entries:
+        for entry in entries:
+            ext = _IMAGE_EXT.search(entry.name)
+            if not ext or not entry.is_file():
+                continue
+            ext_rank = _IMAGE_EXTS.index(ext.group(1).lower())
+            for number in _SLIDE_NUM.finditer(entry.name, 0, ext.start()):
+                slide_num = int(number.group())
+                rank = (len(number.group()) == 1, ext_rank, entry.name)
+                if slide_num not in best or rank < best[slide_num][0]:
+                    best[slide_num] = (rank, entry.path)
 
-        # Fit within max bounds while preserving aspect ratio
-        if max_width / max_height > aspect_ratio:
-            # Height is the constraint
-            height = max_height
-            width = height * aspect_ratio
-        else:
-            # Width is the constraint
-            width = max_width
-            height = width / aspect_ratio
+    return {slide_num: path for slide_num, (_, path) in best.items()}
 
-        # Center horizontally within the max_width area
-        x_centered = x + (max_width - width) / 2
 
-        slide.shapes.add_picture(
-            screenshot_path,
-            Inches(x_centered), Inches(y), Inches(width), Inches(height)
-        )
-        return True
-    return False
+@functools.lru_cache(maxsize=256)
+def _image_size(path, mtime):
+    """(width, height) of an image, read from its header once per file version"""
+    with _get_pil().open(path) as img:
+        return img.size
 
 
-def add_screenshot_placeholder(slide, x=0.75, y=2.3, width=11.5, height=4.2, label="Add screenshot"):
-    """Add placeholder for missing screenshot"""
-    shape = slide.shapes.add_shape(
-        MSO_SHAPE.ROUNDED_RECTANGLE,
-        Inches(x), Inches(y), Inches(width), Inches(height)
+def add_screenshot(slide, screenshot_path, x=0.75, y=2.3, max_width=11.5, max_height=4.2):
+    """Add screenshot image to slide, preserving aspect ratio"""
+    if not screenshot_path:
+        return False
+    try:
+        # One stat tells us the file exists and keys the size cache
+        mtime = os.stat(screenshot_path).st_mtime
+    except OSError:
+        return False
+
+    # Get original image dimensions
+    img_width, img_height = _image_size(screenshot_path, mtime)
+
+    # Calculate aspect ratio
+    aspect_ratio = img_width / img_height
+
+    # Fit within max bounds while preserving aspect ratio
+    if max_width / max_height > aspect_ratio:
+        # Height is the constraint
+        height = max_height
+        width = height * aspect_ratio
+    else:
+        # Width is the constraint
+        width = max_width
+        height = width / aspect_ratio
+
+    # Center horizontally within the max_width area
+    x_centered = x + (max_width - width) / 2
+
+    # python-pptx keys image parts by SHA1, so a file reused on several
+    # slides is embedded once and shared
+    slide.shapes.add_picture(
+        screenshot_path,
+        Inches(x_centered), _in(y), Inches(width), Inches(height)
     )
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = COLORS['light_gray']
-    shape.line.color.rgb = COLORS['border']
-    shape.line.width = Pt(2)
-    shape.line.dash_style = 2  # Dashed
+    return True
+
+
+def add_screenshot_placeholder(slide, colors, x=0.75, y=2.3, width=11.5, height=4.2, label="Add screenshot"):
+    """Add placeholder for missing screenshot"""
+    shape = add_box(slide, x, y, width, height, fill=colors.light_gray,
+                    line=colors.border, line_width=2, dash=2)  # Dashed
 
     tf = shape.text_frame
     tf.word_wrap = True
     p = tf.paragraphs[0]
-    p.text = f"[{label}]"
-    p.font.size = Pt(16)
-    p.font.color.rgb = COLORS['muted']
+    set_text(p, f"[{label}]", size=16, color=colors.muted)
     p.alignment = PP_ALIGN.CENTER
     tf.anchor = MSO_ANCHOR.MIDDLE
 
@@ -179,640 +315,634 @@ def add_screenshot_placeholder(slide, x=0.75, y=2.3, width=11.5, height=4.2, lab
 
 # ============ HELPER FUNCTIONS ============
 
-def add_context_label(slide, text, color=None):
-    """Add context label at top of slide (e.g., 'THE PROBLEM')"""
-    ctx = slide.shapes.add_textbox(Inches(0.75), Inches(0.6), Inches(3), Inches(0.4))
-    tf = ctx.text_frame
+def add_blank_slide(prs, layout):
+    """Add a slide whose shape ids come from a cached counter"""
+    slide = prs.slides.add_slide(layout)
+    # Builders only ever append shapes, so python-pptx can skip rescanning
+    # the shape tree for the highest id on every add_shape/add_textbox
+    slide.shapes.turbo_add_enabled = True
+    return slide
+
+
+def set_text(p, text, *, size, color, bold=False):
+    """Write text into an empty paragraph and format its runs
+
+    Single-line text is added as one run and formatted in place; text with
+    line breaks goes through p.text, which splits it around <a:br> elements.
+    Writing to the runs rather than p.font avoids a second, paragraph-level
+    set of defaults (<a:defRPr>) that the runs would then inherit from.
+    """
+    if not text:
+        return
+    if '\n' in text or '\v' in text:
+        p.text = text
+        runs = p.runs
+    else:
+        run = p.add_run()
+        run.text = text
+        runs = (run,)
+    for run in runs:
+        font = run.font
+        font.size = _pt(size)
+        if bold:
+            font.bold = True
+        font.color.rgb = color
+
+
+def add_box(slide, x, y, width, height, *, fill, line=None, line_width=None, dash=None):
+    """Add a filled rounded rectangle; line=None leaves it without an outline"""
+    shape = slide.shapes.add_shape(
+        MSO_SHAPE.ROUNDED_RECTANGLE,
+        _in(x), _in(y), _in(width), _in(height)
+    )
+    shape.fill.solid()
+    shape.fill.fore_color.rgb = fill
+    outline = shape.line
+    if line is None:
+        outline.fill.background()
+        return shape
+    outline.color.rgb = line
+    if line_width is not None:
+        outline.width = _pt(line_width)
+    if dash is not None:
+        outline.dash_style = dash
+    return shape
+
+
+def add_text(slide, x, y, width, height, text, *, size, color, bold=False,
+             align=None, wrap=False, line_spacing=None):
+    """Add a textbox holding one formatted paragraph (position in inches)"""
+    box = slide.shapes.add_textbox(_in(x), _in(y), _in(width), _in(height))
+    tf = box.text_frame
+    if wrap:
+        tf.word_wrap = True
     p = tf.paragraphs[0]
-    p.text = text.upper()
-    p.font.size = Pt(12)
-    p.font.bold = True
-    p.font.color.rgb = color or COLORS['primary']
-    return ctx
+    if align is not None:
+        p.alignment = align
+    if line_spacing is not None:
+        p.line_spacing = line_spacing
+    set_text(p, text, size=size, bold=bold, color=color)
+    return box
+
+
+def add_context_label(slide, colors, text, color=None):
+    """Add context label at top of slide, given already in capitals (e.g., 'THE PROBLEM')"""
+    return add_text(slide, 0.75, 0.6, 3, 0.4, text,
+                    size=12, bold=True, color=color or colors.primary)
 
 
-def add_action_title(slide, text, y=1.0):
+def add_action_title(slide, colors, text, y=1.0):
     """Add McKinsey action title - the takeaway, not a topic label"""
-    title_box = slide.shapes.add_textbox(Inches(0.75), Inches(y), Inches(11.8), Inches(1.2))
-    tf = title_box.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = text
-    p.font.size = Pt(28)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['secondary']
-    p.line_spacing = 1.2
-    return title_box
+    return add_text(slide, 0.75, y, 11.8, 1.2, text, size=28, bold=True,
+                    color=colors.secondary, wrap=True, line_spacing=1.2)
+
 
+def add_item_list(slide, x, y, width, pitch, items, *, title_size, desc_size, desc_color):
+    """Add (title, desc, title_color) items as paragraphs of a single textbox
+
+    Each item takes `pitch` inches of vertical space, as if it had its own box.
+    """
+    box = slide.shapes.add_textbox(_in(x), _in(y), _in(width), Inches(pitch * len(items)))
+    tf = box.text_frame
+    # Two single-spaced lines take ~1.2x their point size; pad the rest
+    gap = Pt(pitch * 72 - 1.2 * (title_size + desc_size))
+    for i, (title, desc, title_color) in enumerate(items):
+        p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
+        if i:
+            p.space_before = gap
+        set_text(p, title, size=title_size, bold=True, color=title_color)
+
+        p = tf.add_paragraph()
+        set_text(p, desc, size=desc_size, color=desc_color)
+    return box
 
-def add_card(slide, x, y, width, height, title, content, icon="", title_color=None, border_color=None, bg_color=None):
+
+def add_card(slide, colors, x, y, width, height, title, content, icon="",
+             title_color=None, border_color=None, bg_color=None):
     """Add a card with title and content"""
-    card = slide.shapes.add_shape(
-        MSO_SHAPE.ROUNDED_RECTANGLE,
-        Inches(x), Inches(y), Inches(width), Inches(height)
-    )
-    card.fill.solid()
-    card.fill.fore_color.rgb = bg_color or COLORS['white']
-    card.line.color.rgb = border_color or COLORS['border']
-    card.line.width = Pt(1)
+    card = add_box(slide, x, y, width, height, fill=bg_color or colors.white,
+                   line=border_color or colors.border, line_width=1)
 
     title_y = y + 0.2
-    title_box = slide.shapes.add_textbox(
-        Inches(x + 0.2), Inches(title_y), Inches(width - 0.4), Inches(0.5)
-    )
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = f"{icon}  {title}" if icon else title
-    p.font.size = Pt(14)
-    p.font.bold = True
-    p.font.color.rgb = title_color or COLORS['primary']
+    add_text(slide, x + 0.2, title_y, width - 0.4, 0.5,
+             icon + TITLE_INDENT + title if icon else title,
+             size=14, bold=True, color=title_color or colors.primary)
 
-    content_box = slide.shapes.add_textbox(
-        Inches(x + 0.2), Inches(title_y + 0.5), Inches(width - 0.4), Inches(height - 0.8)
-    )
-    tf = content_box.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = content
-    p.font.size = Pt(12)
-    p.font.color.rgb = COLORS['muted']
-    p.line_spacing = 1.4
+    if content:
+        add_text(slide, x + 0.2, title_y + 0.5, width - 0.4, height - 0.8, content,
+                 size=12, color=colors.muted, wrap=True, line_spacing=1.4)
 
     return card
 
 
+def render_card_grid(slide, y, items, *, width, height, gap, value_at, label_at,
+                     inset=0, centered=True, label_bold=False, border_width=2):
+    """Render a left-to-right row of value/label cards from item dicts
+
+    Each item supplies 'value', 'label', 'value_color', 'label_color', 'fill'
+    and 'border' (None for a borderless card). value_at and label_at are
+    (y offset, height, font pt) of the two text lines within the card.
+    """
+    text_width = width - 2 * inset
+    align = PP_ALIGN.CENTER if centered else None
+    # Emit the two text lines top to bottom
+    lines = sorted([(value_at, 'value', True), (label_at, 'label', label_bold)])
+    x = 0.75
+    for item in items:
+        add_box(slide, x, y, width, height, fill=item['fill'],
+                line=item['border'], line_width=border_width)
+
+        for (dy, line_height, size), key, bold in lines:
+            add_text(slide, x + inset, y + dy, text_width, line_height, item[key],
+                     size=size, bold=bold, color=item[key + '_color'], align=align)
+
+        x += width + gap
+
+
 def add_speaker_notes(slide, text):
     """Add speaker notes to slide"""
-    notes = slide.notes_slide
-    notes.notes_text_frame.text = text
+    # Accessing notes_slide creates the notes part, so skip it when empty
+    if not text or not text.strip():
+        return
+    tf = slide.notes_slide.notes_text_frame
+    tf.text = text
+
+
+# ============ DEFAULT CONTENT ============
+# Fallback for any key missing from config, merged in once per deck.
+# Color slots take an RGBColor or the name of an entry in the active palette.
+
+CONTENT_DEFAULTS = MappingProxyType({
+    'product_name': 'Your Product',
+    'tagline': 'YOUR TAGLINE HERE',
+    'headline_part1': 'Your industry needs a',
+    'headline_part2': 'better solution',
+    'pillars': (
+        ("Feature 1", "Brief description"),
+        ("Feature 2", "Brief description"),
+        ("Feature 3", "Brief description"),
+    ),
+    'problem_title': 'State the core problem your audience faces',
+    'requirements': (
+        ("Requirement 1", "Why this matters"),
+        ("Requirement 2", "Why this matters"),
+        ("Requirement 3", "Why this matters"),
+    ),
+    'iceberg_above_label': 'THE VISIBLE COST',
+    'iceberg_above_value': '$X.XM',
+    'iceberg_above_subtitle': "...but that's just the start",
+    'iceberg_below_label': 'THE HIDDEN DAMAGE',
+    'iceberg_below_items': (
+        {'title': 'Hidden cost 1', 'desc': 'Description'},
+        {'title': 'Hidden cost 2', 'desc': 'Description'},
+        {'title': 'Hidden cost 3', 'desc': 'Description'},
+    ),
+    'scale_title': 'Show the magnitude of the problem',
+    'scale_subtitle': 'Real data at production scale',
+    'stats': (
+        ('100+', 'metric 1', 'primary', True),
+        ('50K', 'metric 2', 'accent', False),
+        ('8', 'metric 3', 'purple', False),
+    ),
+    'scale_callout': 'Example callout that emphasizes the scale',
+    'architecture_title': 'How your solution works',
+    'demo_good_title': 'Show the happy path',
+    'demo_edge_title': 'Show how you handle edge cases',
+    'proof_title': 'Metrics and evidence',
+    'metrics': (
+        ('95%', 'Metric 1'),
+        ('2.5x', 'Metric 2'),
+        ('100%', 'Metric 3'),
+    ),
+    'audit_title': 'Full audit trail and logging',
+    'roadmap_title': "What's done and what's next",
+    'roadmap_items': (
+        ("✓", "Completed item 1", "Details", 'success'),
+        ("2", "Next milestone", "Details", 'primary'),
+        ("3", "Future goal", "Details", 'primary'),
+    ),
+    'gaps': (
+        ("1", "Known limitation", "Context"),
+        ("2", "Future work", "Context"),
+        ("3", "Open question", "Context"),
+    ),
+    'ask_title': 'What I need from you',
+    'ask_1_title': 'Feedback Request',
+    'ask_1_desc': 'What specific feedback do you want?',
+    'ask_2_title': 'Priority Question',
+    'ask_2_desc': 'What decision do you need help with?',
+})
+
+# Config text shown in capitals, upper-cased once when config is merged
+UPPERCASE_KEYS = ('iceberg_above_label', 'iceberg_below_label')
+
+
+# ============ CUSTOMIZE YOUR CONTENT HERE ============
+# The deck main() generates. Color slots name an entry in the active palette.
+# Read-only (lists are tuples) and shared across decks; pass your own dict to
+# generate_presentation() for variations.
+
+CONFIG = MappingProxyType({
+    'product_name': 'Your Product',
+    'tagline': 'YOUR TAGLINE HERE',
+    'headline_part1': 'Your industry needs a',
+    'headline_part2': 'better solution',
+    'pillars': (
+        ('Feature 1', 'Brief description'),
+        ('Feature 2', 'Brief description'),
+        ('Feature 3', 'Brief description'),
+    ),
+    'problem_title': 'State the core problem — be specific',
+    'requirements': (
+        ('Requirement 1', 'Why this matters'),
+        ('Requirement 2', 'Why this matters'),
+        ('Requirement 3', 'Why this matters'),
+    ),
+    'iceberg_above_label': 'The visible cost',
+    'iceberg_above_value': '$X.XM',
+    'iceberg_above_subtitle': "...but that's just the start",
+    'iceberg_below_label': 'The hidden damage',
+    'iceberg_below_items': (
+        {'title': 'Hidden cost 1', 'desc': 'No audit trail = no answer'},
+        {'title': 'Hidden cost 2', 'desc': 'Triggered by missing records'},
+        {'title': 'Hidden cost 3', 'desc': 'Wrong answer → wrong decision'},
+    ),
+    'scale_title': 'Built on real data at production scale',
+    'scale_subtitle': 'Actual data — indexed and ready',
+    'stats': (
+        ('100+', 'documents', 'primary', True),
+        ('50K', 'searchable items', 'accent', False),
+        ('8', 'categories', 'purple', False),
+    ),
+    'scale_callout': 'Example: A single document can be 1,000+ pages',
+    'architecture_title': 'How it works — architecture overview',
+    'demo_good_title': 'A well-grounded result',
+    'demo_edge_title': 'Handling edge cases — the key differentiator',
+    'proof_title': 'Metrics that prove it works',
+    'metrics': (
+        ('95%', 'Metric 1'),
+        ('2.5x', 'Metric 2'),
+        ('100%', 'Metric 3'),
+    ),
+    'audit_title': 'Complete decision lineage — every step logged',
+    'roadmap_title': "What's done — and what's next",
+    'roadmap_items': (
+        ("✓", "Core functionality", "Validated with tests", 'success'),
+        ("2", "Next milestone", "In progress", 'primary'),
+        ("3", "Future goal", "Planned", 'primary'),
+    ),
+    'gaps': (
+        ("1", "Known limitation", "Context here"),
+        ("2", "Future work", "Context here"),
+        ("3", "Open question", "Context here"),
+    ),
+    'ask_title': 'Your feedback — and guidance on priorities',
+    'ask_1_title': 'Feedback on Implementation',
+    'ask_1_desc': 'Is this approach sound?',
+    'ask_2_title': 'What to Prioritize Next?',
+    'ask_2_desc': 'Which feature should come first?',
+})
 
 
 # ============ SLIDE BUILDERS ============
 
-def slide_1_title(prs, config):
+def slide_1_title(slide, config, colors, screenshots=None):
     """Slide 1: Title - Your product and value prop"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    title_box = add_text(slide, 0.75, 1.5, 6, 1.5, config['headline_part1'],
+                         size=36, bold=True, color=colors.secondary, wrap=True)
 
-    title_box = slide.shapes.add_textbox(Inches(0.75), Inches(1.5), Inches(6), Inches(1.5))
-    tf = title_box.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = config.get('headline_part1', 'Your industry needs a')
-    p.font.size = Pt(36)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['secondary']
-
-    p = tf.add_paragraph()
-    p.text = config.get('headline_part2', 'better solution')
-    p.font.size = Pt(36)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['primary']
+    p = title_box.text_frame.add_paragraph()
+    set_text(p, config['headline_part2'], size=36, bold=True, color=colors.primary)
 
     # Product name box
-    brand_shape = slide.shapes.add_shape(
-        MSO_SHAPE.ROUNDED_RECTANGLE,
-        Inches(7.5), Inches(1.2), Inches(4.5), Inches(2.5)
-    )
-    brand_shape.fill.solid()
-    brand_shape.fill.fore_color.rgb = COLORS['primary']
-    brand_shape.line.fill.background()
+    add_box(slide, 7.5, 1.2, 4.5, 2.5, fill=colors.primary)
 
-    gx_box = slide.shapes.add_textbox(Inches(7.5), Inches(1.6), Inches(4.5), Inches(1.2))
-    tf = gx_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = config.get('product_name', 'Your Product')
-    p.font.size = Pt(48)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['white']
-    p.alignment = PP_ALIGN.CENTER
+    add_text(slide, 7.5, 1.6, 4.5, 1.2, config['product_name'],
+             size=48, bold=True, color=colors.white, align=PP_ALIGN.CENTER)
 
-    subtitle = slide.shapes.add_textbox(Inches(7.5), Inches(2.9), Inches(4.5), Inches(0.5))
-    tf = subtitle.text_frame
-    p = tf.paragraphs[0]
-    p.text = config.get('tagline', 'YOUR TAGLINE HERE')
-    p.font.size = Pt(11)
-    p.font.color.rgb = RGBColor(0xA0, 0xC4, 0xE8)
-    p.alignment = PP_ALIGN.CENTER
+    add_text(slide, 7.5, 2.9, 4.5, 0.5, config['tagline'],
+             size=11, color=_rgb(SUBTITLE_BLUE), align=PP_ALIGN.CENTER)
 
     # Feature pillars
-    pillars = config.get('pillars', [
-        ("Feature 1", "Brief description"),
-        ("Feature 2", "Brief description"),
-        ("Feature 3", "Brief description"),
-    ])
+    pillars = config['pillars']
     pillar_x = 0.75
     for title, desc in pillars:
-        add_card(slide, pillar_x, 4.5, 3.6, 1.8, title, desc)
+        add_card(slide, colors, pillar_x, 4.5, 3.6, 1.8, title, desc)
         pillar_x += 3.9
 
-    add_speaker_notes(slide, """TIMING: 30 seconds
-SAY: Lead with your value prop
-TRANSITION: Click next to show the problem""")
-
-    return slide
+    return SPEAKER_NOTES[1]
 
 
-def slide_2_problem_iceberg(prs, config):
+def slide_2_problem_iceberg(slide, config, colors, screenshots=None):
     """Slide 2: The Problem - Iceberg Storytelling Design"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    ice = resolve_palette('iceberg')
 
-    ICE = PALETTES['iceberg']
-
-    add_context_label(slide, "The Problem", COLORS['danger'])
-    add_action_title(slide, config.get('problem_title', 'State the core problem your audience faces'))
+    add_context_label(slide, colors, "THE PROBLEM", colors.danger)
+    add_action_title(slide, colors, config['problem_title'])
 
     # Left side: Requirements
-    reqs = config.get('requirements', [
-        ("Requirement 1", "Why this matters"),
-        ("Requirement 2", "Why this matters"),
-        ("Requirement 3", "Why this matters"),
-    ])
-    req_y = 2.6
-    for title, desc in reqs:
-        box = slide.shapes.add_textbox(Inches(0.75), Inches(req_y), Inches(5), Inches(0.6))
-        tf = box.text_frame
-        p = tf.paragraphs[0]
-        p.text = f"  {title}"
-        p.font.size = Pt(14)
-        p.font.bold = True
-        p.font.color.rgb = COLORS['secondary']
-        p = tf.add_paragraph()
-        p.text = f"     {desc}"
-        p.font.size = Pt(12)
-        p.font.color.rgb = COLORS['muted']
-        req_y += 0.8
+    reqs = config['requirements']
+    add_item_list(slide, 0.75, 2.6, 5, 0.8,
+                  [(TITLE_INDENT + title, DESC_INDENT + desc, colors.secondary) for title, desc in reqs],
+                  title_size=14, desc_size=12, desc_color=colors.muted)
 
     # Right side: Iceberg visualization
     iceberg_x = 6.3
     iceberg_width = 5.7
 
     # Sky (above water)
-    sky = slide.shapes.add_shape(
-        MSO_SHAPE.ROUNDED_RECTANGLE,
-        Inches(iceberg_x), Inches(2.4), Inches(iceberg_width), Inches(1.8)
-    )
-    sky.fill.solid()
-    sky.fill.fore_color.rgb = ICE['sky']
-    sky.line.fill.background()
+    add_box(slide, iceberg_x, 2.4, iceberg_width, 1.8, fill=ice.sky)
 
-    label1 = slide.shapes.add_textbox(Inches(iceberg_x), Inches(2.5), Inches(iceberg_width), Inches(0.3))
-    tf = label1.text_frame
-    p = tf.paragraphs[0]
-    p.text = config.get('iceberg_above_label', 'THE VISIBLE COST').upper()
-    p.font.size = Pt(10)
-    p.font.bold = True
-    p.font.color.rgb = ICE['text_sky']
-    p.alignment = PP_ALIGN.CENTER
+    add_text(slide, iceberg_x, 2.5, iceberg_width, 0.3,
+             config['iceberg_above_label'],
+             size=10, bold=True, color=ice.text_sky, align=PP_ALIGN.CENTER)
 
-    amount_box = slide.shapes.add_textbox(Inches(iceberg_x), Inches(2.85), Inches(iceberg_width), Inches(0.8))
-    tf = amount_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = config.get('iceberg_above_value', '$X.XM')
-    p.font.size = Pt(40)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(0xEA, 0x58, 0x0C)
-    p.alignment = PP_ALIGN.CENTER
+    add_text(slide, iceberg_x, 2.85, iceberg_width, 0.8,
+             config['iceberg_above_value'],
+             size=40, bold=True, color=_rgb(ALERT_ORANGE), align=PP_ALIGN.CENTER)
 
-    sub_box = slide.shapes.add_textbox(Inches(iceberg_x), Inches(3.6), Inches(iceberg_width), Inches(0.3))
-    tf = sub_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = config.get('iceberg_above_subtitle', "...but that's just the start")
-    p.font.size = Pt(11)
-    p.font.color.rgb = COLORS['muted']
-    p.alignment = PP_ALIGN.CENTER
+    add_text(slide, iceberg_x, 3.6, iceberg_width, 0.3,
+             config['iceberg_above_subtitle'],
+             size=11, color=colors.muted, align=PP_ALIGN.CENTER)
 
     # Ocean (below water)
-    ocean = slide.shapes.add_shape(
-        MSO_SHAPE.ROUNDED_RECTANGLE,
-        Inches(iceberg_x), Inches(4.2), Inches(iceberg_width), Inches(2.6)
-    )
-    ocean.fill.solid()
-    ocean.fill.fore_color.rgb = ICE['ocean_deep']
-    ocean.line.fill.background()
+    add_box(slide, iceberg_x, 4.2, iceberg_width, 2.6, fill=ice.ocean_deep)
 
-    label2 = slide.shapes.add_textbox(Inches(iceberg_x), Inches(4.35), Inches(iceberg_width), Inches(0.3))
-    tf = label2.text_frame
-    p = tf.paragraphs[0]
-    p.text = config.get('iceberg_below_label', 'THE HIDDEN DAMAGE').upper()
-    p.font.size = Pt(10)
-    p.font.bold = True
-    p.font.color.rgb = ICE['sky_mid']
-    p.alignment = PP_ALIGN.CENTER
+    add_text(slide, iceberg_x, 4.35, iceberg_width, 0.3,
+             config['iceberg_below_label'],
+             size=10, bold=True, color=ice.sky_mid, align=PP_ALIGN.CENTER)
 
     # Below water items
-    below_items = config.get('iceberg_below_items', [
-        {'title': 'Hidden cost 1', 'desc': 'Description'},
-        {'title': 'Hidden cost 2', 'desc': 'Description'},
-        {'title': 'Hidden cost 3', 'desc': 'Description'},
-    ])
-    item_y = 4.7
-    for item in below_items[:3]:
-        item_box = slide.shapes.add_textbox(Inches(iceberg_x + 0.3), Inches(item_y), Inches(iceberg_width - 0.6), Inches(0.55))
-        tf = item_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = item['title']
-        p.font.size = Pt(12)
-        p.font.bold = True
-        p.font.color.rgb = ICE['text_light']
-
-        p = tf.add_paragraph()
-        p.text = item['desc']
-        p.font.size = Pt(10)
-        p.font.color.rgb = ICE['sky_mid']
+    below_items = config['iceberg_below_items']
+    add_item_list(slide, iceberg_x + 0.3, 4.7, iceberg_width - 0.6, 0.6,
+                  [(item['title'], item['desc'], ice.text_light) for item in below_items[:3]],
+                  title_size=12, desc_size=10, desc_color=ice.sky_mid)
 
-        item_y += 0.6
+    return SPEAKER_NOTES[2]
 
-    add_speaker_notes(slide, """TIMING: 45 seconds
-SAY: The visible cost is just the tip of the iceberg.
-TRANSITION: "Here's the scale we're dealing with..." """)
-
-    return slide
 
-
-def slide_3_scale(prs, config):
+def slide_3_scale(slide, config, colors, screenshots=None):
     """Slide 3: Dataset/Problem Scale"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    add_context_label(slide, colors, "THE SCALE")
+    add_action_title(slide, colors, config['scale_title'])
 
-    add_context_label(slide, "The Scale")
-    add_action_title(slide, config.get('scale_title', 'Show the magnitude of the problem'))
+    add_text(slide, 0.75, 1.9, 11, 0.5, config['scale_subtitle'],
+             size=16, color=colors.muted)
 
-    subtitle = slide.shapes.add_textbox(Inches(0.75), Inches(1.9), Inches(11), Inches(0.5))
-    tf = subtitle.text_frame
-    p = tf.paragraphs[0]
-    p.text = config.get('scale_subtitle', 'Real data at production scale')
-    p.font.size = Pt(16)
-    p.font.color.rgb = COLORS['muted']
-
-    stats = config.get('stats', [
-        ('100+', 'metric 1', COLORS['primary'], True),
-        ('50K', 'metric 2', COLORS['accent'], False),
-        ('8', 'metric 3', COLORS['purple'], False),
-    ])
-
-    card_width = 3.7
-    card_height = 2.2
-    card_y = 2.8
-    gap = 0.3
-    card_x = 0.75
+    stats = config['stats']
 
+    subtitle = _rgb(SUBTITLE_BLUE)
+    cards = []
     for value, label, color, is_filled in stats:
-        card = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            Inches(card_x), Inches(card_y), Inches(card_width), Inches(card_height)
-        )
-        card.fill.solid()
+        color = as_rgb(color, colors)
         if is_filled:
-            card.fill.fore_color.rgb = color
-            card.line.fill.background()
-            text_color = COLORS['white']
-            label_color = RGBColor(0xA0, 0xC4, 0xE8)
+            cards.append({'value': value, 'label': label, 'fill': color, 'border': None,
+                          'value_color': colors.white, 'label_color': subtitle})
         else:
-            card.fill.fore_color.rgb = COLORS['white']
-            card.line.color.rgb = COLORS['border']
-            card.line.width = Pt(2)
-            text_color = color
-            label_color = COLORS['muted']
-
-        num_box = slide.shapes.add_textbox(Inches(card_x), Inches(card_y + 0.4), Inches(card_width), Inches(1))
-        tf = num_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = value
-        p.font.size = Pt(56)
-        p.font.bold = True
-        p.font.color.rgb = text_color
-        p.alignment = PP_ALIGN.CENTER
-
-        label_box = slide.shapes.add_textbox(Inches(card_x), Inches(card_y + 1.5), Inches(card_width), Inches(0.5))
-        tf = label_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = label
-        p.font.size = Pt(14)
-        p.font.color.rgb = label_color
-        p.alignment = PP_ALIGN.CENTER
-
-        card_x += card_width + gap
+            cards.append({'value': value, 'label': label, 'fill': colors.white, 'border': colors.border,
+                          'value_color': color, 'label_color': colors.muted})
+    render_card_grid(slide, 2.8, cards, width=3.7, height=2.2, gap=0.3,
+                     value_at=(0.4, 1, 56), label_at=(1.5, 0.5, 14))
 
     # Callout
-    callout = slide.shapes.add_shape(
-        MSO_SHAPE.ROUNDED_RECTANGLE,
-        Inches(0.75), Inches(5.3), Inches(11.5), Inches(0.9)
-    )
-    callout.fill.solid()
-    callout.fill.fore_color.rgb = RGBColor(0xFF, 0xFB, 0xEB)
-    callout.line.color.rgb = RGBColor(0xFC, 0xD3, 0x4D)
-    callout.line.width = Pt(1)
-
-    callout_text = slide.shapes.add_textbox(Inches(1), Inches(5.5), Inches(11), Inches(0.6))
-    tf = callout_text.text_frame
-    p = tf.paragraphs[0]
-    p.text = config.get('scale_callout', 'Example callout that emphasizes the scale')
-    p.font.size = Pt(14)
-    p.font.color.rgb = RGBColor(0x92, 0x40, 0x0E)
+    add_box(slide, 0.75, 5.3, 11.5, 0.9, fill=_rgb(CALLOUT_FILL),
+            line=_rgb(CALLOUT_BORDER), line_width=1)
 
-    add_speaker_notes(slide, """TIMING: 30 seconds
-SAY: Emphasize the magnitude
-TRANSITION: "Here's the architecture..." """)
+    add_text(slide, 1, 5.5, 11, 0.6,
+             config['scale_callout'],
+             size=14, color=_rgb(CALLOUT_TEXT))
 
-    return slide
+    return SPEAKER_NOTES[3]
 
 
-def slide_4_architecture(prs, config, screenshots_dir=None):
+def slide_4_architecture(slide, config, colors, screenshots=None):
     """Slide 4: Solution Architecture"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    add_context_label(slide, "Architecture")
-    add_action_title(slide, config.get('architecture_title', 'How your solution works'))
+    add_context_label(slide, colors, "ARCHITECTURE")
+    add_action_title(slide, colors, config['architecture_title'])
 
-    screenshot = find_screenshot(screenshots_dir, SCREENSHOT_SLIDES.get(4, ''), 4)
+    screenshot = screenshots.get(4) if screenshots else None
     if not add_screenshot(slide, screenshot):
-        add_screenshot_placeholder(slide, label="Architecture diagram (4.png)")
+        add_screenshot_placeholder(slide, colors, label="Architecture diagram (4.png)")
 
-    add_speaker_notes(slide, """TIMING: 45 seconds
-SAY: Walk through the architecture
-SHOW: Point to each stage""")
-    return slide
+    return SPEAKER_NOTES[4]
 
 
-def slide_5_demo_good(prs, config, screenshots_dir=None):
+def slide_5_demo_good(slide, config, colors, screenshots=None):
     """Slide 5: Demo - Happy Path"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    add_context_label(slide, "Live Demo", COLORS['accent'])
-    add_action_title(slide, config.get('demo_good_title', 'Show the happy path'))
+    add_context_label(slide, colors, "LIVE DEMO", colors.accent)
+    add_action_title(slide, colors, config['demo_good_title'])
 
-    screenshot = find_screenshot(screenshots_dir, SCREENSHOT_SLIDES.get(5, ''), 5)
+    screenshot = screenshots.get(5) if screenshots else None
     if not add_screenshot(slide, screenshot):
-        add_screenshot_placeholder(slide, label="Demo screenshot - happy path (5.png)")
+        add_screenshot_placeholder(slide, colors, label="Demo screenshot - happy path (5.png)")
 
-    add_speaker_notes(slide, """TIMING: 60 seconds
-SAY: "Watch what happens when..."
-SHOW: Run the demo""")
-    return slide
+    return SPEAKER_NOTES[5]
 
 
-def slide_6_demo_edge(prs, config, screenshots_dir=None):
+def slide_6_demo_edge(slide, config, colors, screenshots=None):
     """Slide 6: Demo - Edge Case / Differentiator"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    add_context_label(slide, "Edge Case", COLORS['danger'])
-    add_action_title(slide, config.get('demo_edge_title', 'Show how you handle edge cases'))
+    add_context_label(slide, colors, "EDGE CASE", colors.danger)
+    add_action_title(slide, colors, config['demo_edge_title'])
 
-    screenshot = find_screenshot(screenshots_dir, SCREENSHOT_SLIDES.get(6, ''), 6)
+    screenshot = screenshots.get(6) if screenshots else None
     if not add_screenshot(slide, screenshot):
-        add_screenshot_placeholder(slide, label="Demo screenshot - edge case (6.png)")
+        add_screenshot_placeholder(slide, colors, label="Demo screenshot - edge case (6.png)")
 
-    add_speaker_notes(slide, """TIMING: 60 seconds
-SAY: "This is the key differentiator"
-SHOW: Edge case handling""")
-    return slide
+    return SPEAKER_NOTES[6]
 
 
-def slide_7_proof(prs, config, screenshots_dir=None):
+def slide_7_proof(slide, config, colors, screenshots=None):
     """Slide 7: Results / Proof"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    add_context_label(slide, "The Proof", COLORS['accent'])
-    add_action_title(slide, config.get('proof_title', 'Metrics and evidence'))
+    add_context_label(slide, colors, "THE PROOF", colors.accent)
+    add_action_title(slide, colors, config['proof_title'])
 
-    screenshot = find_screenshot(screenshots_dir, SCREENSHOT_SLIDES.get(7, ''), 7)
+    screenshot = screenshots.get(7) if screenshots else None
     if not add_screenshot(slide, screenshot, max_height=3.5):
         # Show metric cards instead
-        metrics = config.get('metrics', [
-            ('95%', 'Metric 1'),
-            ('2.5x', 'Metric 2'),
-            ('100%', 'Metric 3'),
-        ])
-        card_x = 0.75
-        for value, label in metrics:
-            add_card(slide, card_x, 2.8, 3.6, 2.0, f"✓ {label}", "", title_color=COLORS['accent'])
-            num_box = slide.shapes.add_textbox(Inches(card_x + 0.2), Inches(3.4), Inches(3.2), Inches(0.8))
-            tf = num_box.text_frame
-            p = tf.paragraphs[0]
-            p.text = value
-            p.font.size = Pt(36)
-            p.font.bold = True
-            p.font.color.rgb = COLORS['secondary']
-            card_x += 3.9
-
-    add_speaker_notes(slide, """TIMING: 30 seconds
-SAY: Back up your claims with numbers""")
-    return slide
+        metrics = config['metrics']
+        cards = [{'value': value, 'label': CHECK_PREFIX + label, 'fill': colors.white,
+                  'border': colors.border, 'value_color': colors.secondary, 'label_color': colors.accent}
+                 for value, label in metrics]
+        render_card_grid(slide, 2.8, cards, width=3.6, height=2.0, gap=0.3,
+                         value_at=(0.6, 0.8, 36), label_at=(0.2, 0.5, 14),
+                         inset=0.2, centered=False, label_bold=True, border_width=1)
+
+    return SPEAKER_NOTES[7]
 
 
-def slide_8_audit(prs, config, screenshots_dir=None):
+def slide_8_audit(slide, config, colors, screenshots=None):
     """Slide 8: Audit Trail / Traceability (optional)"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    add_context_label(slide, "Traceability", COLORS['purple'])
-    add_action_title(slide, config.get('audit_title', 'Full audit trail and logging'))
+    add_context_label(slide, colors, "TRACEABILITY", colors.purple)
+    add_action_title(slide, colors, config['audit_title'])
 
-    screenshot = find_screenshot(screenshots_dir, SCREENSHOT_SLIDES.get(8, ''), 8)
+    screenshot = screenshots.get(8) if screenshots else None
     if not add_screenshot(slide, screenshot):
-        add_screenshot_placeholder(slide, label="Audit trail view (8.png)")
+        add_screenshot_placeholder(slide, colors, label="Audit trail view (8.png)")
 
-    add_speaker_notes(slide, """TIMING: 30 seconds
-SAY: Complete traceability""")
-    return slide
+    return SPEAKER_NOTES[8]
 
 
-def slide_9_roadmap(prs, config):
+def slide_9_roadmap(slide, config, colors, screenshots=None):
     """Slide 9: Roadmap + Honest Gaps"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-
-    add_context_label(slide, "Roadmap")
-    add_action_title(slide, config.get('roadmap_title', "What's done and what's next"))
-
-    # Left: Progress
-    progress_shape = slide.shapes.add_shape(
-        MSO_SHAPE.ROUNDED_RECTANGLE,
-        Inches(0.75), Inches(2.5), Inches(5.3), Inches(4)
+    add_context_label(slide, colors, "ROADMAP")
+    add_action_title(slide, colors, config['roadmap_title'])
+
+    # Left: Progress, right: Gaps, as (heading, heading color, list items)
+    panels = (
+        ("Progress", colors.primary,
+         [(str(num) + NUM_GAP + title, DESC_INDENT + desc, as_rgb(color, colors))
+          for num, title, desc, color in config['roadmap_items']]),
+        ("Honest Gaps", colors.warning,
+         [(str(num) + NUM_GAP + title, DESC_INDENT + desc, colors.warning)
+          for num, title, desc in config['gaps']]),
     )
-    progress_shape.fill.solid()
-    progress_shape.fill.fore_color.rgb = COLORS['white']
-    progress_shape.line.color.rgb = COLORS['border']
-
-    prog_header = slide.shapes.add_textbox(Inches(1), Inches(2.7), Inches(4.8), Inches(0.5))
-    tf = prog_header.text_frame
-    p = tf.paragraphs[0]
-    p.text = "Progress"
-    p.font.size = Pt(16)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['primary']
-
-    items = config.get('roadmap_items', [
-        ("✓", "Completed item 1", "Details", COLORS['success']),
-        ("2", "Next milestone", "Details", COLORS['primary']),
-        ("3", "Future goal", "Details", COLORS['primary']),
-    ])
-    item_y = 3.3
-    for num, title, desc, color in items:
-        box = slide.shapes.add_textbox(Inches(1), Inches(item_y), Inches(4.8), Inches(0.7))
-        tf = box.text_frame
-        p = tf.paragraphs[0]
-        p.text = f"{num}   {title}"
-        p.font.size = Pt(13)
-        p.font.bold = True
-        p.font.color.rgb = color
-        p = tf.add_paragraph()
-        p.text = f"     {desc}"
-        p.font.size = Pt(11)
-        p.font.color.rgb = COLORS['muted']
-        item_y += 0.8
-
-    # Right: Gaps
-    gaps_shape = slide.shapes.add_shape(
-        MSO_SHAPE.ROUNDED_RECTANGLE,
-        Inches(6.4), Inches(2.5), Inches(5.3), Inches(4)
-    )
-    gaps_shape.fill.solid()
-    gaps_shape.fill.fore_color.rgb = COLORS['white']
-    gaps_shape.line.color.rgb = COLORS['border']
-
-    gaps_header = slide.shapes.add_textbox(Inches(6.65), Inches(2.7), Inches(4.8), Inches(0.5))
-    tf = gaps_header.text_frame
-    p = tf.paragraphs[0]
-    p.text = "Honest Gaps"
-    p.font.size = Pt(16)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['warning']
+    for x, (heading, heading_color, items) in zip(PANEL_X, panels):
+        add_box(slide, x, 2.5, 5.3, 4, fill=colors.white, line=colors.border)
+        add_text(slide, x + PANEL_INSET, 2.7, 4.8, 0.5, heading, size=16, bold=True, color=heading_color)
+        add_item_list(slide, x + PANEL_INSET, 3.3, 4.8, 0.8, items,
+                      title_size=13, desc_size=11, desc_color=colors.muted)
 
-    gaps = config.get('gaps', [
-        ("1", "Known limitation", "Context"),
-        ("2", "Future work", "Context"),
-        ("3", "Open question", "Context"),
-    ])
-    gap_y = 3.3
-    for num, title, desc in gaps:
-        box = slide.shapes.add_textbox(Inches(6.65), Inches(gap_y), Inches(4.8), Inches(0.7))
-        tf = box.text_frame
-        p = tf.paragraphs[0]
-        p.text = f"{num}   {title}"
-        p.font.size = Pt(13)
-        p.font.bold = True
-        p.font.color.rgb = COLORS['warning']
-        p = tf.add_paragraph()
-        p.text = f"     {desc}"
-        p.font.size = Pt(11)
-        p.font.color.rgb = COLORS['muted']
-        gap_y += 0.8
+    return SPEAKER_NOTES[9]
 
-    add_speaker_notes(slide, """TIMING: 30 seconds
-SAY: Be honest about gaps
-SHOW: Point to roadmap""")
 
-    return slide
-
-
-def slide_10_ask(prs, config):
+def slide_10_ask(slide, config, colors, screenshots=None):
     """Slide 10: The Ask"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    add_context_label(slide, colors, "THE ASK")
+    add_action_title(slide, colors, config['ask_title'])
 
-    add_context_label(slide, "The Ask")
-    add_action_title(slide, config.get('ask_title', 'What I need from you'))
-
-    # Question cards
-    q1_shape = slide.shapes.add_shape(
-        MSO_SHAPE.ROUNDED_RECTANGLE,
-        Inches(0.75), Inches(2.3), Inches(5.3), Inches(1.5)
+    # Question cards, as (title, description, title color)
+    questions = (
+        (config['ask_1_title'], config['ask_1_desc'], colors.primary),
+        (config['ask_2_title'], config['ask_2_desc'], colors.warning),
     )
-    q1_shape.fill.solid()
-    q1_shape.fill.fore_color.rgb = COLORS['white']
-    q1_shape.line.color.rgb = COLORS['border']
-
-    q1 = slide.shapes.add_textbox(Inches(1), Inches(2.5), Inches(4.8), Inches(1.2))
-    tf = q1.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = config.get('ask_1_title', 'Feedback Request')
-    p.font.size = Pt(14)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['primary']
-    p = tf.add_paragraph()
-    p.text = config.get('ask_1_desc', 'What specific feedback do you want?')
-    p.font.size = Pt(12)
-    p.font.color.rgb = COLORS['muted']
-
-    q2_shape = slide.shapes.add_shape(
-        MSO_SHAPE.ROUNDED_RECTANGLE,
-        Inches(6.4), Inches(2.3), Inches(5.3), Inches(1.5)
-    )
-    q2_shape.fill.solid()
-    q2_shape.fill.fore_color.rgb = COLORS['white']
-    q2_shape.line.color.rgb = COLORS['border']
-
-    q2 = slide.shapes.add_textbox(Inches(6.65), Inches(2.5), Inches(4.8), Inches(1.2))
-    tf = q2.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = config.get('ask_2_title', 'Priority Question')
-    p.font.size = Pt(14)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['warning']
-    p = tf.add_paragraph()
-    p.text = config.get('ask_2_desc', 'What decision do you need help with?')
-    p.font.size = Pt(12)
-    p.font.color.rgb = COLORS['muted']
+    for x, (title, desc, title_color) in zip(PANEL_X, questions):
+        add_box(slide, x, 2.3, 5.3, 1.5, fill=colors.white, line=colors.border)
+        card = add_text(slide, x + PANEL_INSET, 2.5, 4.8, 1.2, title,
+                        size=14, bold=True, color=title_color, wrap=True)
+        set_text(card.text_frame.add_paragraph(), desc, size=12, color=colors.muted)
 
     # Thank you
-    thanks = slide.shapes.add_textbox(Inches(0.75), Inches(5.5), Inches(11.5), Inches(0.8))
-    tf = thanks.text_frame
-    p = tf.paragraphs[0]
-    p.text = "Thank You"
-    p.font.size = Pt(36)
-    p.font.bold = True
-    p.font.color.rgb = COLORS['primary']
-    p.alignment = PP_ALIGN.CENTER
+    add_text(slide, 0.75, 5.5, 11.5, 0.8, "Thank You",
+             size=36, bold=True, color=colors.primary, align=PP_ALIGN.CENTER)
 
-    questions = slide.shapes.add_textbox(Inches(0.75), Inches(6.2), Inches(11.5), Inches(0.4))
-    tf = questions.text_frame
-    p = tf.paragraphs[0]
-    p.text = "Questions?"
-    p.font.size = Pt(16)
-    p.font.color.rgb = COLORS['muted']
-    p.alignment = PP_ALIGN.CENTER
+    add_text(slide, 0.75, 6.2, 11.5, 0.4, "Questions?",
+             size=16, color=colors.muted, align=PP_ALIGN.CENTER)
 
-    add_speaker_notes(slide, """TIMING: 30 seconds
-SAY: Be specific about what you need
-ASK: Open it up for questions""")
+    return SPEAKER_NOTES[10]
 
-    return slide
 
+# Deck order. Every builder fills in a blank slide, (slide, config, colors, screenshots),
+# where colors is the resolved Palette and screenshots the index_screenshots() map,
+# and returns that slide's speaker notes
+SLIDE_BUILDERS = (
+    slide_1_title,
+    slide_2_problem_iceberg,
+    slide_3_scale,
+    slide_4_architecture,
+    slide_5_demo_good,
+    slide_6_demo_edge,
+    slide_7_proof,
+    slide_8_audit,
+    slide_9_roadmap,
+    slide_10_ask,
+)
 
-# ============ MAIN ============
-
-def generate_presentation(output_path, config=None, screenshots_dir=None, palette='default'):
-    """Generate the full 10-slide presentation"""
-    global COLORS
-    COLORS = PALETTES.get(palette, PALETTES['default'])
 
-    if config is None:
-        config = {}
+# ============ MAIN ============
 
+@functools.lru_cache(maxsize=1)
+def _skeleton_bytes():
+    """Serialized empty 16:9 deck, built once per process"""
     prs = Presentation()
     prs.slide_width = Inches(13.333)  # 16:9
     prs.slide_height = Inches(7.5)
+    buf = io.BytesIO()
+    prs.save(buf)
+    return buf.getvalue()
+
+
+def new_presentation():
+    """Fresh 16:9 Presentation cloned from the cached skeleton"""
+    return Presentation(io.BytesIO(_skeleton_bytes()))
+
+
+def recompress(data, level):
+    """Re-pack saved .pptx bytes at a deflate level (0 = stored, 9 = smallest)"""
+    compression = zipfile.ZIP_STORED if level == 0 else zipfile.ZIP_DEFLATED
+    out = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(data)) as src, \
+            zipfile.ZipFile(out, 'w', compression, compresslevel=level or None) as dst:
+        # Keep part order: [Content_Types].xml must stay first
+        for info in src.infolist():
+            dst.writestr(info.filename, src.read(info))
+    return out.getbuffer()
+
+
+def write_atomic(path, data):
+    """Write bytes to path via a temp file, so readers never see a partial deck"""
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'wb', buffering=1024 * 1024) as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def generate_presentation(output_path, config=None, screenshots_dir=None, palette='default',
+                          compress_level=None, notes=True):
+    """Generate the full 10-slide presentation
+
+    compress_level re-packs the file at that ZIP deflate level (0-9);
+    None keeps python-pptx's default compression. notes=False leaves out
+    speaker notes entirely.
+    """
+    _import_pptx()
+    colors = resolve_palette(palette)
+
+    config = {**CONTENT_DEFAULTS, **(config or {})}
+    for key in UPPERCASE_KEYS:
+        config[key] = config[key].upper()
+
+    prs = new_presentation()
 
     # Check screenshots
     screenshots_found = []
     screenshots_missing = []
+    screenshots = index_screenshots(screenshots_dir)
     if screenshots_dir and Path(screenshots_dir).exists():
         print(f"✓ Screenshots directory: {screenshots_dir}")
-        for slide_num, slide_name in SCREENSHOT_SLIDES.items():
-            if find_screenshot(screenshots_dir, slide_name, slide_num):
+        for slide_num in SCREENSHOT_SLIDES:
+            if slide_num in screenshots:
                 screenshots_found.append(slide_num)
             else:
                 screenshots_missing.append(slide_num)
 
-    # Build all 10 slides
-    slide_1_title(prs, config)
-    slide_2_problem_iceberg(prs, config)
-    slide_3_scale(prs, config)
-    slide_4_architecture(prs, config, screenshots_dir)
-    slide_5_demo_good(prs, config, screenshots_dir)
-    slide_6_demo_edge(prs, config, screenshots_dir)
-    slide_7_proof(prs, config, screenshots_dir)
-    slide_8_audit(prs, config, screenshots_dir)
-    slide_9_roadmap(prs, config)
-    slide_10_ask(prs, config)
-
-    prs.save(output_path)
+    # Resolve the blank layout once and share it across builders
+    blank_layout = prs.slide_layouts[6]
+
+    # Build all slides in deck order
+    built = []
+    for build_slide in SLIDE_BUILDERS:
+        slide = add_blank_slide(prs, blank_layout)
+        built.append((slide, build_slide(slide, config, colors, screenshots)))
+
+    # Attach notes in one pass once every slide exists
+    if notes:
+        for slide, text in built:
+            add_speaker_notes(slide, text)
+
+    # Serialize in memory, then hit the disk with one large buffered write
+    buf = io.BytesIO()
+    prs.save(buf)
+    data = buf.getbuffer()
+    if compress_level is not None:
+        data = recompress(data, compress_level)
+    write_atomic(output_path, data)
     print(f"✓ Generated: {output_path}")
-    print(f"  10 slides with {palette} palette")
+    print(f"  {len(SLIDE_BUILDERS)} slides with {palette} palette")
 
     if screenshots_found:
         print(f"  ✓ Screenshots inserted for slides: {screenshots_found}")
@@ -821,73 +951,28 @@ def generate_presentation(output_path, config=None, screenshots_dir=None, palett
         print(f"    Add to: {screenshots_dir}/")
 
 
-def main():
+def run(output, screenshots=None, palette='default', config=None, compress_level=None, notes=True):
+    """Generate a deck from CONFIG (or a given config) without going through argparse
+
+    Batch callers can import this module and call run() once per deck.
+    """
+    generate_presentation(output, CONFIG if config is None else config, screenshots, palette,
+                          compress_level, notes=notes)
+
+
+def main(argv=None):
     parser = argparse.ArgumentParser(description="Generate Demo PPTX")
     parser.add_argument("--output", "-o", default="demo.pptx", help="Output file path")
     parser.add_argument("--screenshots", "-s", default=None, help="Path to screenshots directory")
     parser.add_argument("--palette", "-p", default="default", choices=['default', 'iceberg'],
                         help="Color palette to use")
-    args = parser.parse_args()
-
-    # ============ CUSTOMIZE YOUR CONTENT HERE ============
-    config = {
-        'product_name': 'Your Product',
-        'tagline': 'YOUR TAGLINE HERE',
-        'headline_part1': 'Your industry needs a',
-        'headline_part2': 'better solution',
-        'pillars': [
-            ('Feature 1', 'Brief description'),
-            ('Feature 2', 'Brief description'),
-            ('Feature 3', 'Brief description'),
-        ],
-        'problem_title': 'State the core problem — be specific',
-        'requirements': [
-            ('Requirement 1', 'Why this matters'),
-            ('Requirement 2', 'Why this matters'),
-            ('Requirement 3', 'Why this matters'),
-        ],
-        'iceberg_above_label': 'The visible cost',
-        'iceberg_above_value': '$X.XM',
-        'iceberg_above_subtitle': "...but that's just the start",
-        'iceberg_below_label': 'The hidden damage',
-        'iceberg_below_items': [
-            {'title': 'Hidden cost 1', 'desc': 'No audit trail = no answer'},
-            {'title': 'Hidden cost 2', 'desc': 'Triggered by missing records'},
-            {'title': 'Hidden cost 3', 'desc': 'Wrong answer → wrong decision'},
-        ],
-        'scale_title': 'Built on real data at production scale',
-        'scale_subtitle': 'Actual data — indexed and ready',
-        'stats': [
-            ('100+', 'documents', PALETTES['default']['primary'], True),
-            ('50K', 'searchable items', PALETTES['default']['accent'], False),
-            ('8', 'categories', PALETTES['default']['purple'], False),
-        ],
-        'scale_callout': 'Example: A single document can be 1,000+ pages',
-        'architecture_title': 'How it works — architecture overview',
-        'demo_good_title': 'A well-grounded result',
-        'demo_edge_title': 'Handling edge cases — the key differentiator',
-        'proof_title': 'Metrics that prove it works',
-        'metrics': [('95%', 'Metric 1'), ('2.5x', 'Metric 2'), ('100%', 'Metric 3')],
-        'audit_title': 'Complete decision lineage — every step logged',
-        'roadmap_title': "What's done — and what's next",
-        'roadmap_items': [
-            ("✓", "Core functionality", "Validated with tests", PALETTES['default']['success']),
-            ("2", "Next milestone", "In progress", PALETTES['default']['primary']),
-            ("3", "Future goal", "Planned", PALETTES['default']['primary']),
-        ],
-        'gaps': [
-            ("1", "Known limitation", "Context here"),
-            ("2", "Future work", "Context here"),
-            ("3", "Open question", "Context here"),
-        ],
-        'ask_title': 'Your feedback — and guidance on priorities',
-        'ask_1_title': 'Feedback on Implementation',
-        'ask_1_desc': 'Is this approach sound?',
-        'ask_2_title': 'What to Prioritize Next?',
-        'ask_2_desc': 'Which feature should come first?',
-    }
-
-    generate_presentation(args.output, config, args.screenshots, args.palette)
+    parser.add_argument("--compress-level", type=int, default=None, choices=range(10), metavar="0-9",
+                        help="ZIP deflate level for the output (0 = uncompressed, 9 = smallest)")
+    parser.add_argument("--no-notes", action="store_true", help="Leave out speaker notes")
+    args = parser.parse_args(argv)
+
+    run(args.output, args.screenshots, args.palette, compress_level=args.compress_level,
+        notes=not args.no_notes)
 
 
 if __name__ == "__main__":